@@ -9,7 +9,7 @@ from contextlib import contextmanager
 from flask import Blueprint, request, current_app
 from PIL import Image
 from models import db, Settings
-from utils import success_response, error_response, bad_request
+from utils import success_payload, success_response, error_response, bad_request
 from config import Config, PROJECT_ROOT
 from services.ai_service import AIService
 from services.file_parser_service import FileParserService
@@ -22,6 +22,128 @@ settings_bp = Blueprint(
     "settings", __name__, url_prefix="/api/settings"
 )
 
+# Serialized snapshot of the settings row, kept per app in
+# current_app.extensions so that GET /api/settings does not need to load,
+# hydrate and encode the full row on every request.
+#
+# A warm GET still costs one SELECT: the snapshot is tagged with the row's
+# updated_at and revalidated with a single-column query on each read. That
+# round-trip is kept on purpose so writes from outside this controller
+# (another process, a migration, a manual fix) are picked up as long as they
+# bump updated_at - the model's onupdate does this for ORM writes. Raw SQL
+# that leaves updated_at untouched is not detected.
+#
+# The snapshot is an immutable (updated_at, data, json_bytes) tuple that is
+# swapped as a whole, so concurrent readers never see a half-updated entry.
+_SETTINGS_CACHE_KEY = "settings_cache"
+
+
+def _load_settings_cache() -> tuple:
+    """Return the (updated_at, data, json_bytes) snapshot, reloading it if the DB row has changed"""
+    snapshot = current_app.extensions.get(_SETTINGS_CACHE_KEY)
+    marker = Settings.query.with_entities(Settings.updated_at).limit(1).scalar()
+    if snapshot is None or marker is None or marker != snapshot[0]:
+        snapshot = _refresh_settings_cache(Settings.get_settings())
+    return snapshot
+
+
+def _get_settings_cached_json():
+    """Return the GET /api/settings response built from pre-encoded JSON bytes"""
+    return current_app.response_class(
+        _load_settings_cache()[2], mimetype="application/json"
+    )
+
+
+def _refresh_settings_cache(settings: Settings) -> tuple:
+    """Store a fresh snapshot of the settings row (call after commit)"""
+    data = settings.to_dict()
+    json_bytes = current_app.json.dumps(success_payload(data)).encode("utf-8")
+    snapshot = (settings.updated_at, data, json_bytes)
+    current_app.extensions[_SETTINGS_CACHE_KEY] = snapshot
+    return snapshot
+
+
+def _invalidate_settings_cache():
+    """Drop the cached snapshot so the next read goes to the DB"""
+    current_app.extensions.pop(_SETTINGS_CACHE_KEY, None)
+
+
+_ALLOWED_PROVIDERS = frozenset({"openai", "gemini"})
+_ALLOWED_RESOLUTIONS = frozenset({"1K", "2K", "4K"})
+_ALLOWED_OUTPUT_LANGUAGES = frozenset({"zh", "en", "ja", "auto"})
+_ALLOWED_WORKER_RANGE = range(1, 21)
+_ALLOWED_THINKING_BUDGET_RANGE = range(1, 8193)
+
+# Config / .env snapshots used by reset_settings, keyed by AI_PROVIDER_FORMAT
+_reset_defaults_cache: dict = {}
+
+
+def _normalize_base_url(value):
+    """Empty string from frontend means: clear override, fall back to env/default"""
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value if value != "" else None
+
+
+def _strip_or_none(value):
+    """Strip optional string fields, empty values fall back to Config"""
+    return (value or "").strip() or None
+
+
+def _or_none(value):
+    return value or None
+
+
+def _one_of(allowed, message: str):
+    """Build a validator that accepts only values in ``allowed`` (a frozenset or range)"""
+    def validate(value):
+        try:
+            return None if value in allowed else message
+        except TypeError:
+            # Unhashable JSON values (lists, objects) can't be in a frozenset
+            return message
+    return validate
+
+
+# Fields accepted by PUT /api/settings, applied in order: (name, cast, validate)
+# - cast: optional conversion applied to the raw request value
+# - validate: optional check returning an error message, or None if valid
+FIELD_SPECS = [
+    # AI provider format configuration
+    ("ai_provider_format", None,
+     _one_of(_ALLOWED_PROVIDERS, "AI provider format must be 'openai' or 'gemini'")),
+    # API configuration
+    ("api_base_url", _normalize_base_url, None),
+    ("api_key", None, None),
+    # Image generation configuration
+    ("image_resolution", None,
+     _one_of(_ALLOWED_RESOLUTIONS, "Resolution must be 1K, 2K, or 4K")),
+    ("image_aspect_ratio", None, None),
+    # Worker configuration
+    ("max_description_workers", int,
+     _one_of(_ALLOWED_WORKER_RANGE, "Max description workers must be between 1 and 20")),
+    ("max_image_workers", int,
+     _one_of(_ALLOWED_WORKER_RANGE, "Max image workers must be between 1 and 20")),
+    # Model & MinerU configuration (optional, empty values fall back to Config)
+    ("text_model", _strip_or_none, None),
+    ("image_model", _strip_or_none, None),
+    ("mineru_api_base", _strip_or_none, None),
+    ("mineru_token", None, None),
+    ("image_caption_model", _strip_or_none, None),
+    ("output_language", None,
+     _one_of(_ALLOWED_OUTPUT_LANGUAGES, "Output language must be 'zh', 'en', 'ja', or 'auto'")),
+    # Reasoning mode configuration (separate for text and image)
+    ("enable_text_reasoning", bool, None),
+    ("text_thinking_budget", int,
+     _one_of(_ALLOWED_THINKING_BUDGET_RANGE, "Text thinking budget must be between 1 and 8192")),
+    ("enable_image_reasoning", bool, None),
+    ("image_thinking_budget", int,
+     _one_of(_ALLOWED_THINKING_BUDGET_RANGE, "Image thinking budget must be between 1 and 8192")),
+    # Baidu OCR configuration
+    ("baidu_ocr_api_key", _or_none, None),
+]
+
 
 @contextmanager
 def temporary_settings_override(settings_override: dict):
@@ -120,8 +242,7 @@ def get_settings():
     GET /api/settings - Get application settings
     """
     try:
-        settings = Settings.get_settings()
-        return success_response(settings.to_dict())
+        return _get_settings_cached_json()
     except Exception as e:
         logger.error(f"Error getting settings: {str(e)}")
         return error_response(
@@ -144,6 +265,8 @@ def update_settings():
             "image_aspect_ratio": "16:9"
         }
     """
+    # Single timestamp for this request, reused wherever it is stamped
+    now = datetime.now(timezone.utc)
     try:
         data = request.get_json()
         if not data:
@@ -151,113 +274,38 @@ def update_settings():
 
         settings = Settings.get_settings()
 
-        # Update AI provider format configuration
-        if "ai_provider_format" in data:
-            provider_format = data["ai_provider_format"]
-            if provider_format not in ["openai", "gemini"]:
-                return bad_request("AI provider format must be 'openai' or 'gemini'")
-            settings.ai_provider_format = provider_format
-
-        # Update API configuration
-        if "api_base_url" in data:
-            raw_base_url = data["api_base_url"]
-            # Empty string from frontend means "clear override, fall back to env/default"
-            if raw_base_url is None:
-                settings.api_base_url = None
-            else:
-                value = str(raw_base_url).strip()
-                settings.api_base_url = value if value != "" else None
-
-        if "api_key" in data:
-            settings.api_key = data["api_key"]
-
-        # Update image generation configuration
-        if "image_resolution" in data:
-            resolution = data["image_resolution"]
-            if resolution not in ["1K", "2K", "4K"]:
-                return bad_request("Resolution must be 1K, 2K, or 4K")
-            settings.image_resolution = resolution
-
-        if "image_aspect_ratio" in data:
-            aspect_ratio = data["image_aspect_ratio"]
-            settings.image_aspect_ratio = aspect_ratio
-
-        # Update worker configuration
-        if "max_description_workers" in data:
-            workers = int(data["max_description_workers"])
-            if workers < 1 or workers > 20:
-                return bad_request(
-                    "Max description workers must be between 1 and 20"
-                )
-            settings.max_description_workers = workers
-
-        if "max_image_workers" in data:
-            workers = int(data["max_image_workers"])
-            if workers < 1 or workers > 20:
-                return bad_request(
-                    "Max image workers must be between 1 and 20"
-                )
-            settings.max_image_workers = workers
-
-        # Update model & MinerU configuration (optional, empty values fall back to Config)
-        if "text_model" in data:
-            settings.text_model = (data["text_model"] or "").strip() or None
-
-        if "image_model" in data:
-            settings.image_model = (data["image_model"] or "").strip() or None
-
-        if "mineru_api_base" in data:
-            settings.mineru_api_base = (data["mineru_api_base"] or "").strip() or None
-
-        if "mineru_token" in data:
-            settings.mineru_token = data["mineru_token"]
-
-        if "image_caption_model" in data:
-            settings.image_caption_model = (data["image_caption_model"] or "").strip() or None
-
-        if "output_language" in data:
-            language = data["output_language"]
-            if language in ["zh", "en", "ja", "auto"]:
-                settings.output_language = language
-            else:
-                return bad_request("Output language must be 'zh', 'en', 'ja', or 'auto'")
-
-        # Update reasoning mode configuration (separate for text and image)
-        if "enable_text_reasoning" in data:
-            settings.enable_text_reasoning = bool(data["enable_text_reasoning"])
-        
-        if "text_thinking_budget" in data:
-            budget = int(data["text_thinking_budget"])
-            if budget < 1 or budget > 8192:
-                return bad_request("Text thinking budget must be between 1 and 8192")
-            settings.text_thinking_budget = budget
-        
-        if "enable_image_reasoning" in data:
-            settings.enable_image_reasoning = bool(data["enable_image_reasoning"])
-        
-        if "image_thinking_budget" in data:
-            budget = int(data["image_thinking_budget"])
-            if budget < 1 or budget > 8192:
-                return bad_request("Image thinking budget must be between 1 and 8192")
-            settings.image_thinking_budget = budget
-
-        # Update Baidu OCR configuration
-        if "baidu_ocr_api_key" in data:
-            settings.baidu_ocr_api_key = data["baidu_ocr_api_key"] or None
-
-        settings.updated_at = datetime.now(timezone.utc)
+        for name, cast, validate in FIELD_SPECS:
+            if name not in data:
+                continue
+            value = cast(data[name]) if cast else data[name]
+            error = validate(value) if validate else None
+            if error:
+                return bad_request(error)
+            setattr(settings, name, value)
+
+        # Idempotent PUT: values match the DB row, skip updated_at and the commit.
+        # The row was just loaded, so refresh the cache from it rather than trusting the snapshot,
+        # and still sync app.config in case the row was written outside this controller
+        if not db.session.is_modified(settings):
+            logger.debug("Settings unchanged, skipping commit")
+            snapshot = _refresh_settings_cache(settings)
+            _sync_settings_to_config(settings)
+            return success_response(snapshot[1], "Settings updated successfully")
+
+        settings.updated_at = now
         db.session.commit()
 
+        snapshot = _refresh_settings_cache(settings)
+
         # Sync to app.config
         _sync_settings_to_config(settings)
 
         logger.info("Settings updated successfully")
-        return success_response(
-            settings.to_dict(), "Settings updated successfully"
-        )
+        return success_response(snapshot[1], "Settings updated successfully")
 
     except Exception as e:
         db.session.rollback()
+        _invalidate_settings_cache()
         logger.error(f"Error updating settings: {str(e)}")
         return error_response(
             "UPDATE_SETTINGS_ERROR",
@@ -266,6 +314,52 @@ def update_settings():
         )
 
 
+def _get_reset_defaults() -> dict:
+    """
+    Default settings values from Config / .env, built once per provider format
+
+    Priority logic:
+    - Check AI_PROVIDER_FORMAT
+    - If "openai" -> use OPENAI_API_BASE / OPENAI_API_KEY
+    - Otherwise (default "gemini") -> use GOOGLE_API_BASE / GOOGLE_API_KEY
+    """
+    provider_format = Config.AI_PROVIDER_FORMAT
+    defaults = _reset_defaults_cache.get(provider_format)
+    if defaults is not None:
+        return defaults
+
+    if (provider_format or "").lower() == "openai":
+        default_api_base = Config.OPENAI_API_BASE or None
+        default_api_key = Config.OPENAI_API_KEY or None
+    else:
+        default_api_base = Config.GOOGLE_API_BASE or None
+        default_api_key = Config.GOOGLE_API_KEY or None
+
+    defaults = {
+        "ai_provider_format": provider_format,
+        "api_base_url": default_api_base,
+        "api_key": default_api_key,
+        "text_model": Config.TEXT_MODEL,
+        "image_model": Config.IMAGE_MODEL,
+        "mineru_api_base": Config.MINERU_API_BASE,
+        "mineru_token": Config.MINERU_TOKEN,
+        "image_caption_model": Config.IMAGE_CAPTION_MODEL,
+        "output_language": 'zh',  # 重置为默认中文
+        # 重置推理模式配置
+        "enable_text_reasoning": False,
+        "text_thinking_budget": 1024,
+        "enable_image_reasoning": False,
+        "image_thinking_budget": 1024,
+        "baidu_ocr_api_key": Config.BAIDU_OCR_API_KEY or None,
+        "image_resolution": Config.DEFAULT_RESOLUTION,
+        "image_aspect_ratio": Config.DEFAULT_ASPECT_RATIO,
+        "max_description_workers": Config.MAX_DESCRIPTION_WORKERS,
+        "max_image_workers": Config.MAX_IMAGE_WORKERS,
+    }
+    _reset_defaults_cache[provider_format] = defaults
+    return defaults
+
+
 @settings_bp.route("/reset", methods=["POST"], strict_slashes=False)
 def reset_settings():
     """
@@ -275,51 +369,23 @@ def reset_settings():
         settings = Settings.get_settings()
 
         # Reset to default values from Config / .env
-        # Priority logic:
-        # - Check AI_PROVIDER_FORMAT
-        # - If "openai" -> use OPENAI_API_BASE / OPENAI_API_KEY
-        # - Otherwise (default "gemini") -> use GOOGLE_API_BASE / GOOGLE_API_KEY
-        settings.ai_provider_format = Config.AI_PROVIDER_FORMAT
-
-        if (Config.AI_PROVIDER_FORMAT or "").lower() == "openai":
-            default_api_base = Config.OPENAI_API_BASE or None
-            default_api_key = Config.OPENAI_API_KEY or None
-        else:
-            default_api_base = Config.GOOGLE_API_BASE or None
-            default_api_key = Config.GOOGLE_API_KEY or None
-
-        settings.api_base_url = default_api_base
-        settings.api_key = default_api_key
-        settings.text_model = Config.TEXT_MODEL
-        settings.image_model = Config.IMAGE_MODEL
-        settings.mineru_api_base = Config.MINERU_API_BASE
-        settings.mineru_token = Config.MINERU_TOKEN
-        settings.image_caption_model = Config.IMAGE_CAPTION_MODEL
-        settings.output_language = 'zh'  # 重置为默认中文
-        # 重置推理模式配置
-        settings.enable_text_reasoning = False
-        settings.text_thinking_budget = 1024
-        settings.enable_image_reasoning = False
-        settings.image_thinking_budget = 1024
-        settings.baidu_ocr_api_key = Config.BAIDU_OCR_API_KEY or None
-        settings.image_resolution = Config.DEFAULT_RESOLUTION
-        settings.image_aspect_ratio = Config.DEFAULT_ASPECT_RATIO
-        settings.max_description_workers = Config.MAX_DESCRIPTION_WORKERS
-        settings.max_image_workers = Config.MAX_IMAGE_WORKERS
+        for name, value in _get_reset_defaults().items():
+            setattr(settings, name, value)
         settings.updated_at = datetime.now(timezone.utc)
 
         db.session.commit()
 
+        snapshot = _refresh_settings_cache(settings)
+
         # Sync to app.config
         _sync_settings_to_config(settings)
 
         logger.info("Settings reset to defaults")
-        return success_response(
-            settings.to_dict(), "Settings reset to defaults"
-        )
+        return success_response(snapshot[1], "Settings reset to defaults")
 
     except Exception as e:
         db.session.rollback()
+        _invalidate_settings_cache()
         logger.error(f"Error resetting settings: {str(e)}")
         return error_response(
             "RESET_SETTINGS_ERROR",
@@ -419,110 +485,123 @@ def verify_api_key():
 
 def _sync_settings_to_config(settings: Settings):
     """Sync settings to Flask app config and clear AI service cache if needed"""
+    config = current_app.config
+    # Collect writes and removals, then apply them in one batch at the end
+    updates = {}
+    pops = []
     # Track if AI-related settings changed
     ai_config_changed = False
     
     # Sync AI provider format (always sync, has default value)
     if settings.ai_provider_format:
-        old_format = current_app.config.get("AI_PROVIDER_FORMAT")
+        old_format = config.get("AI_PROVIDER_FORMAT")
         if old_format != settings.ai_provider_format:
             ai_config_changed = True
-            logger.info(f"AI provider format changed: {old_format} -> {settings.ai_provider_format}")
-        current_app.config["AI_PROVIDER_FORMAT"] = settings.ai_provider_format
+            logger.info("AI provider format changed: %s -> %s", old_format, settings.ai_provider_format)
+        updates["AI_PROVIDER_FORMAT"] = settings.ai_provider_format
     
     # Sync API configuration (sync to both GOOGLE_* and OPENAI_* to ensure DB settings override env vars)
     if settings.api_base_url is not None:
-        old_base = current_app.config.get("GOOGLE_API_BASE")
+        old_base = config.get("GOOGLE_API_BASE")
         if old_base != settings.api_base_url:
             ai_config_changed = True
-            logger.info(f"API base URL changed: {old_base} -> {settings.api_base_url}")
-        current_app.config["GOOGLE_API_BASE"] = settings.api_base_url
-        current_app.config["OPENAI_API_BASE"] = settings.api_base_url
+            logger.info("API base URL changed: %s -> %s", old_base, settings.api_base_url)
+        updates["GOOGLE_API_BASE"] = settings.api_base_url
+        updates["OPENAI_API_BASE"] = settings.api_base_url
     else:
         # Remove overrides, fall back to env variables or defaults
-        if "GOOGLE_API_BASE" in current_app.config or "OPENAI_API_BASE" in current_app.config:
+        if "GOOGLE_API_BASE" in config or "OPENAI_API_BASE" in config:
             ai_config_changed = True
             logger.info("API base URL cleared, falling back to defaults")
-        current_app.config.pop("GOOGLE_API_BASE", None)
-        current_app.config.pop("OPENAI_API_BASE", None)
+        pops.extend(("GOOGLE_API_BASE", "OPENAI_API_BASE"))
 
     if settings.api_key is not None:
-        old_key = current_app.config.get("GOOGLE_API_KEY")
+        old_key = config.get("GOOGLE_API_KEY")
         # Compare actual values to detect any change (but don't log the keys for security)
         if old_key != settings.api_key:
             ai_config_changed = True
             logger.info("API key updated")
-        current_app.config["GOOGLE_API_KEY"] = settings.api_key
-        current_app.config["OPENAI_API_KEY"] = settings.api_key
+        updates["GOOGLE_API_KEY"] = settings.api_key
+        updates["OPENAI_API_KEY"] = settings.api_key
     else:
         # Remove overrides, fall back to env variables or defaults
-        if "GOOGLE_API_KEY" in current_app.config or "OPENAI_API_KEY" in current_app.config:
+        if "GOOGLE_API_KEY" in config or "OPENAI_API_KEY" in config:
             ai_config_changed = True
             logger.info("API key cleared, falling back to defaults")
-        current_app.config.pop("GOOGLE_API_KEY", None)
-        current_app.config.pop("OPENAI_API_KEY", None)
+        pops.extend(("GOOGLE_API_KEY", "OPENAI_API_KEY"))
     
     # Check model changes
     if settings.text_model is not None:
-        old_model = current_app.config.get("TEXT_MODEL")
+        old_model = config.get("TEXT_MODEL")
         if old_model != settings.text_model:
             ai_config_changed = True
-            logger.info(f"Text model changed: {old_model} -> {settings.text_model}")
-        current_app.config["TEXT_MODEL"] = settings.text_model
+            logger.info("Text model changed: %s -> %s", old_model, settings.text_model)
+        updates["TEXT_MODEL"] = settings.text_model
     
     if settings.image_model is not None:
-        old_model = current_app.config.get("IMAGE_MODEL")
+        old_model = config.get("IMAGE_MODEL")
         if old_model != settings.image_model:
             ai_config_changed = True
-            logger.info(f"Image model changed: {old_model} -> {settings.image_model}")
-        current_app.config["IMAGE_MODEL"] = settings.image_model
-
-    # Sync image generation settings
-    current_app.config["DEFAULT_RESOLUTION"] = settings.image_resolution
-    current_app.config["DEFAULT_ASPECT_RATIO"] = settings.image_aspect_ratio
-
-    # Sync worker settings
-    current_app.config["MAX_DESCRIPTION_WORKERS"] = settings.max_description_workers
-    current_app.config["MAX_IMAGE_WORKERS"] = settings.max_image_workers
-    logger.info(f"Updated worker settings: desc={settings.max_description_workers}, img={settings.max_image_workers}")
+            logger.info("Image model changed: %s -> %s", old_model, settings.image_model)
+        updates["IMAGE_MODEL"] = settings.image_model
+
+    # Sync image generation and worker settings
+    updates["DEFAULT_RESOLUTION"] = settings.image_resolution
+    updates["DEFAULT_ASPECT_RATIO"] = settings.image_aspect_ratio
+    updates["MAX_DESCRIPTION_WORKERS"] = settings.max_description_workers
+    updates["MAX_IMAGE_WORKERS"] = settings.max_image_workers
+    logger.info(
+        "Updated worker settings: desc=%s, img=%s",
+        settings.max_description_workers, settings.max_image_workers,
+    )
 
     # Sync MinerU settings (optional, fall back to Config defaults if None)
     if settings.mineru_api_base:
-        current_app.config["MINERU_API_BASE"] = settings.mineru_api_base
-        logger.info(f"Updated MINERU_API_BASE to: {settings.mineru_api_base}")
+        updates["MINERU_API_BASE"] = settings.mineru_api_base
+        logger.info("Updated MINERU_API_BASE to: %s", settings.mineru_api_base)
     if settings.mineru_token is not None:
-        current_app.config["MINERU_TOKEN"] = settings.mineru_token
+        updates["MINERU_TOKEN"] = settings.mineru_token
         logger.info("Updated MINERU_TOKEN from settings")
     if settings.image_caption_model:
-        current_app.config["IMAGE_CAPTION_MODEL"] = settings.image_caption_model
-        logger.info(f"Updated IMAGE_CAPTION_MODEL to: {settings.image_caption_model}")
+        updates["IMAGE_CAPTION_MODEL"] = settings.image_caption_model
+        logger.info("Updated IMAGE_CAPTION_MODEL to: %s", settings.image_caption_model)
     if settings.output_language:
-        current_app.config["OUTPUT_LANGUAGE"] = settings.output_language
-        logger.info(f"Updated OUTPUT_LANGUAGE to: {settings.output_language}")
+        updates["OUTPUT_LANGUAGE"] = settings.output_language
+        logger.info("Updated OUTPUT_LANGUAGE to: %s", settings.output_language)
     
     # Sync reasoning mode settings (separate for text and image)
     # Check if reasoning configuration changed (requires AIService cache clear)
-    old_text_reasoning = current_app.config.get("ENABLE_TEXT_REASONING")
-    old_text_budget = current_app.config.get("TEXT_THINKING_BUDGET")
-    old_image_reasoning = current_app.config.get("ENABLE_IMAGE_REASONING")
-    old_image_budget = current_app.config.get("IMAGE_THINKING_BUDGET")
+    old_text_reasoning = config.get("ENABLE_TEXT_REASONING")
+    old_text_budget = config.get("TEXT_THINKING_BUDGET")
+    old_image_reasoning = config.get("ENABLE_IMAGE_REASONING")
+    old_image_budget = config.get("IMAGE_THINKING_BUDGET")
     
     if (old_text_reasoning != settings.enable_text_reasoning or 
         old_text_budget != settings.text_thinking_budget or
         old_image_reasoning != settings.enable_image_reasoning or
         old_image_budget != settings.image_thinking_budget):
         ai_config_changed = True
-        logger.info(f"Reasoning config changed: text={old_text_reasoning}({old_text_budget})->{settings.enable_text_reasoning}({settings.text_thinking_budget}), image={old_image_reasoning}({old_image_budget})->{settings.enable_image_reasoning}({settings.image_thinking_budget})")
+        logger.info(
+            "Reasoning config changed: text=%s(%s)->%s(%s), image=%s(%s)->%s(%s)",
+            old_text_reasoning, old_text_budget,
+            settings.enable_text_reasoning, settings.text_thinking_budget,
+            old_image_reasoning, old_image_budget,
+            settings.enable_image_reasoning, settings.image_thinking_budget,
+        )
     
-    current_app.config["ENABLE_TEXT_REASONING"] = settings.enable_text_reasoning
-    current_app.config["TEXT_THINKING_BUDGET"] = settings.text_thinking_budget
-    current_app.config["ENABLE_IMAGE_REASONING"] = settings.enable_image_reasoning
-    current_app.config["IMAGE_THINKING_BUDGET"] = settings.image_thinking_budget
+    updates["ENABLE_TEXT_REASONING"] = settings.enable_text_reasoning
+    updates["TEXT_THINKING_BUDGET"] = settings.text_thinking_budget
+    updates["ENABLE_IMAGE_REASONING"] = settings.enable_image_reasoning
+    updates["IMAGE_THINKING_BUDGET"] = settings.image_thinking_budget
     
     # Sync Baidu OCR settings
     if settings.baidu_ocr_api_key:
-        current_app.config["BAIDU_OCR_API_KEY"] = settings.baidu_ocr_api_key
+        updates["BAIDU_OCR_API_KEY"] = settings.baidu_ocr_api_key
         logger.info("Updated BAIDU_OCR_API_KEY from settings")
+
+    config.update(updates)
+    for key in pops:
+        config.pop(key, None)
     
     # Clear AI service cache if AI-related configuration changed
     if ai_config_changed:
@@ -531,7 +610,7 @@ def _sync_settings_to_config(settings: Settings):
             clear_ai_service_cache()
             logger.warning("AI configuration changed - AIService cache cleared. New providers will be created on next request.")
         except Exception as e:
-            logger.error(f"Failed to clear AI service cache: {e}")
+            logger.error("Failed to clear AI service cache: %s", e)
 
 
 def _get_test_image_path() -> Path:
@@ -0,0 +1,178 @@
+"""
+设置API单元测试
+"""
+
+import pytest
+from unittest.mock import patch
+from conftest import assert_success_response, assert_error_response
+
+
+class TestSettingsGet:
+    """获取设置测试"""
+
+    def test_get_settings(self, client):
+        """测试获取设置"""
+        response = client.get('/api/settings')
+
+        assert response.mimetype == 'application/json'
+        data = assert_success_response(response)
+        assert data['message'] == 'Success'
+        assert data['data']['id'] == 1
+        assert 'image_resolution' in data['data']
+        assert 'api_key_length' in data['data']
+
+    def test_get_settings_reflects_update(self, client):
+        """测试更新后再次获取能拿到最新值"""
+        client.get('/api/settings')
+        response = client.put('/api/settings', json={'image_resolution': '4K'})
+        assert_success_response(response)
+
+        response = client.get('/api/settings')
+        data = assert_success_response(response)
+        assert data['data']['image_resolution'] == '4K'
+
+    def test_get_settings_picks_up_external_write(self, client):
+        """测试绕过接口直接写库后，获取设置能拿到最新值"""
+        from models import db, Settings
+
+        client.get('/api/settings')
+        settings = Settings.get_settings()
+        settings.image_resolution = '1K' if settings.image_resolution != '1K' else '4K'
+        expected = settings.image_resolution
+        db.session.commit()
+
+        response = client.get('/api/settings')
+        data = assert_success_response(response)
+        assert data['data']['image_resolution'] == expected
+
+
+class TestSettingsUpdate:
+    """更新设置测试"""
+
+    def test_update_settings(self, client):
+        """测试更新设置"""
+        response = client.put('/api/settings', json={
+            'image_resolution': '1K',
+            'max_image_workers': 3,
+            'api_key': 'secret-key',
+        })
+
+        data = assert_success_response(response)
+        assert data['data']['image_resolution'] == '1K'
+        assert data['data']['max_image_workers'] == 3
+        assert data['data']['api_key_length'] == len('secret-key')
+
+    def test_update_settings_invalid_resolution(self, client):
+        """测试无效的分辨率"""
+        response = client.put('/api/settings', json={'image_resolution': '8K'})
+
+        assert_error_response(response, 400)
+
+    def test_update_settings_normalizes_values(self, client):
+        """测试空字符串会被清空为默认值"""
+        response = client.put('/api/settings', json={
+            'api_base_url': '  ',
+            'text_model': '  gemini-test  ',
+            'image_model': '',
+        })
+
+        data = assert_success_response(response)
+        assert data['data']['api_base_url'] is None
+        assert data['data']['text_model'] == 'gemini-test'
+        assert data['data']['image_model'] is None
+
+    @pytest.mark.parametrize('payload', [
+        {'ai_provider_format': 'claude'},
+        {'ai_provider_format': ['openai']},
+        {'image_resolution': ['1K']},
+        {'output_language': {}},
+        {'max_description_workers': 0},
+        {'max_image_workers': 21},
+        {'output_language': 'fr'},
+        {'text_thinking_budget': 9000},
+    ])
+    def test_update_settings_rejects_invalid_values(self, client, payload):
+        """测试超出范围或不支持的取值"""
+        response = client.put('/api/settings', json=payload)
+
+        assert_error_response(response, 400)
+
+    def test_update_settings_syncs_app_config(self, client, app):
+        """测试更新后同步到app.config，清空的覆盖项会被移除"""
+        response = client.put('/api/settings', json={
+            'api_base_url': 'https://api.example.com',
+            'image_resolution': '1K',
+        })
+        assert_success_response(response)
+        assert app.config['GOOGLE_API_BASE'] == 'https://api.example.com'
+        assert app.config['OPENAI_API_BASE'] == 'https://api.example.com'
+        assert app.config['DEFAULT_RESOLUTION'] == '1K'
+
+        response = client.put('/api/settings', json={'api_base_url': ''})
+        assert_success_response(response)
+        assert 'GOOGLE_API_BASE' not in app.config
+        assert 'OPENAI_API_BASE' not in app.config
+
+    def test_update_settings_unchanged_skips_write(self, client):
+        """测试提交与当前值相同的设置时不会写库"""
+        from models import db
+
+        client.get('/api/settings')
+        response = client.put('/api/settings', json={'image_resolution': '1K'})
+        first = assert_success_response(response)['data']
+        assert first['image_resolution'] == '1K'
+
+        with patch.object(db.session, 'commit') as mock_commit:
+            response = client.put('/api/settings', json={'image_resolution': '1K'})
+            second = assert_success_response(response)['data']
+            mock_commit.assert_not_called()
+        assert second['updated_at'] == first['updated_at']
+
+        response = client.put('/api/settings', json={'image_resolution': '4K'})
+        third = assert_success_response(response)['data']
+        assert third['image_resolution'] == '4K'
+        assert third['updated_at'] != first['updated_at']
+
+    def test_update_settings_unchanged_returns_db_state(self, client, app):
+        """测试无变更的更新返回数据库中的最新值，而不是旧缓存，并同步到app.config"""
+        from models import db, Settings
+
+        client.get('/api/settings')
+        settings = Settings.get_settings()
+        settings.text_model = 'oob-model'
+        db.session.commit()
+
+        response = client.put('/api/settings', json={'text_model': 'oob-model'})
+        data = assert_success_response(response)
+        assert data['data']['text_model'] == 'oob-model'
+        assert app.config['TEXT_MODEL'] == 'oob-model'
+
+    def test_update_settings_empty_body(self, client):
+        """测试缺少请求体"""
+        response = client.put('/api/settings', json={})
+
+        assert_error_response(response, 400)
+
+
+class TestSettingsReset:
+    """重置设置测试"""
+
+    def test_reset_settings(self, client):
+        """测试重置为Config默认值"""
+        from config import Config
+
+        client.put('/api/settings', json={
+            'image_resolution': '4K' if Config.DEFAULT_RESOLUTION != '4K' else '1K',
+            'output_language': 'en',
+            'text_thinking_budget': 2048,
+        })
+
+        response = client.post('/api/settings/reset')
+        data = assert_success_response(response)
+        assert data['data']['image_resolution'] == Config.DEFAULT_RESOLUTION
+        assert data['data']['output_language'] == 'zh'
+        assert data['data']['text_thinking_budget'] == 1024
+
+        response = client.get('/api/settings')
+        data = assert_success_response(response)
+        assert data['data']['image_resolution'] == Config.DEFAULT_RESOLUTION
@@ -1,5 +1,6 @@
 """Utils package"""
 from .response import (
+    success_payload,
     success_response, 
     error_response, 
     bad_request, 
@@ -14,6 +15,7 @@ from .pptx_builder import PPTXBuilder
 from .page_utils import parse_page_ids_from_query, parse_page_ids_from_body, get_filtered_pages
 
 __all__ = [
+    'success_payload',
     'success_response',
     'error_response',
     'bad_request',
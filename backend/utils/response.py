@@ -5,17 +5,16 @@ from flask import jsonify
 from typing import Any, Dict, Optional
 
 
-def success_response(data: Any = None, message: str = "Success", status_code: int = 200):
+def success_payload(data: Any = None, message: str = "Success") -> Dict[str, Any]:
     """
-    Generate a successful response
+    Build the body of a successful response
     
     Args:
         data: Response data
         message: Success message
-        status_code: HTTP status code
     
     Returns:
-        Flask response with JSON format
+        Response body dict (not yet serialized)
     """
     response = {
         "success": True,
@@ -25,7 +24,22 @@ def success_response(data: Any = None, message: str = "Success", status_code: in
     if data is not None:
         response["data"] = data
     
-    return jsonify(response), status_code
+    return response
+
+
+def success_response(data: Any = None, message: str = "Success", status_code: int = 200):
+    """
+    Generate a successful response
+    
+    Args:
+        data: Response data
+        message: Success message
+        status_code: HTTP status code
+    
+    Returns:
+        Flask response with JSON format
+    """
+    return jsonify(success_payload(data, message)), status_code
 
 
 def error_response(error_code: str, message: str, status_code: int = 400):